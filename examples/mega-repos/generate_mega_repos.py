@@ -1,18 +1,25 @@
 #!/usr/bin/env python3
 """
 MASSIVE REPOSITORY FACTORY - Generates 1000 realistic repositories (5001-6000)
-Each with full git history, realistic code, tests, documentation, and evolution
+Each with realistic code, tests and documentation, committed to git; pass
+--history for the full multi-commit evolution instead of a single initial commit
 """
 
+import io
 import os
 import sys
-import json
 import random
+import argparse
+import functools
+import shutil
+import tarfile
+import tempfile
 import subprocess
+import multiprocessing
+from array import array
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
-import hashlib
+from typing import List, Dict, Any, Optional, Tuple
 
 # Repository Templates Configuration
 REPO_CATEGORIES = {
@@ -117,6 +124,31 @@ LANGUAGES = {
     'c#': {'weight': 0.02, 'extensions': ['.cs']},
 }
 
+# Microservice names: the base services, then suffixed copies (auth-1, user-1, ...) up to 100
+_MS_BASE = ('auth', 'user', 'product', 'order', 'payment', 'inventory',
+            'notification', 'analytics', 'search', 'recommendation')
+_MS_NAMES_100 = tuple(_MS_BASE[i % 10] + (f'-{i // 10}' if i >= 10 else '') for i in range(100))
+
+# Language lookups derived once from LANGUAGES
+_LANG_KEYS = tuple(LANGUAGES)
+_LANG_WEIGHTS = tuple(v['weight'] for v in LANGUAGES.values())
+_LANG_EXT = {k: v['extensions'][0] for k, v in LANGUAGES.items()}
+
+# Number of 32-bit values drawn at once by RepoGenerator._randint
+_RNG_BATCH = 1024
+
+# Pre-initialized .git directory copied into each repository (see _make_git_template)
+_GIT_TEMPLATE = None
+
+# Per-invocation git overrides: these repos are throwaway fixtures, so skip fsync,
+# auto-gc and signing. Passed with -c so nothing is persisted into .git/config.
+_GIT_FAST_CONFIG = (
+    '-c', 'core.fsync=none',
+    '-c', 'core.fsyncMethod=batch',
+    '-c', 'gc.auto=0',
+    '-c', 'commit.gpgSign=false',
+)
+
 # Contributor names for realistic commits
 CONTRIBUTORS = [
     ('John Smith', 'john.smith@example.com'),
@@ -136,49 +168,665 @@ CONTRIBUTORS = [
     ('Christopher Jackson', 'cjackson@example.com'),
 ]
 
-class RepoGenerator:
-    """Generates realistic repository with full git history"""
+# Fixed imports/logger preamble shared by every generated Python module
+_PY_HEADER = '''import logging
+import typing
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+'''
+
+# Boilerplate shared by every generated repository
+_LICENSE_MIT_BYTES = b'''MIT License
+
+Copyright (c) 2024
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction.
+'''
+
+_GITIGNORE_BYTES = b'''# Dependencies
+node_modules/
+vendor/
+__pycache__/
+*.pyc
+target/
+
+# Build
+dist/
+build/
+*.so
+*.exe
+
+# IDE
+.vscode/
+.idea/
+*.swp
+
+# Environment
+.env
+.env.local
+
+# Logs
+*.log
+logs/
+'''
 
-    def __init__(self, repo_id: int, category: str, template: str, base_path: str):
+_GITHUB_ACTIONS_CI_BYTES = b'''name: CI
+
+on: [push, pull_request]
+
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v3
+      - name: Run tests
+        run: |
+          npm install
+          npm test
+
+  build:
+    runs-on: ubuntu-latest
+    needs: test
+    steps:
+      - uses: actions/checkout@v3
+      - name: Build
+        run: npm run build
+'''
+
+# Invariant manifest/infrastructure files
+_REQUIREMENTS_TXT = '''requests>=2.28.0
+pydantic>=1.10.0
+pytest>=7.2.0
+black>=22.10.0
+flake8>=5.0.0
+'''
+
+_GEMFILE = '''source 'https://rubygems.org'
+
+gem 'rails', '~> 7.0'
+gem 'pg', '~> 1.4'
+
+group :development, :test do
+  gem 'rspec-rails', '~> 6.0'
+end
+'''
+
+_DOCKER_COMPOSE_YML = '''version: '3.8'
+services:
+  app:
+    build: .
+    ports:
+      - "8000:8000"
+    environment:
+      - DATABASE_URL=postgresql://user:pass@db:5432/dbname
+  db:
+    image: postgres:15
+    environment:
+      - POSTGRES_PASSWORD=pass
+'''
+
+_TERRAFORM_MAIN_TF = '''terraform {
+  required_version = ">= 1.0"
+}
+
+provider "aws" {
+  region = "us-west-2"
+}
+
+resource "aws_instance" "app" {
+  ami           = "ami-0c55b159cbfafe1f0"
+  instance_type = "t2.micro"
+}
+'''
+
+_SQL_MIGRATION = '''-- Migration: Create users table
+CREATE TABLE users (
+    id SERIAL PRIMARY KEY,
+    username VARCHAR(255) NOT NULL,
+    email VARCHAR(255) UNIQUE NOT NULL,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX idx_users_email ON users(email);
+'''
+
+_DOCKERFILE_PYTHON = '''FROM python:3.11-slim
+WORKDIR /app
+COPY requirements.txt .
+RUN pip install -r requirements.txt
+COPY . .
+CMD ["python", "src/main.py"]
+'''
+
+_DOCKERFILE_NODE = '''FROM node:18-alpine
+WORKDIR /app
+COPY package*.json ./
+RUN npm install
+COPY . .
+CMD ["npm", "start"]
+'''
+
+# Manifest/infrastructure files with {name} (repo name) / {template} slots
+# Equivalent to json.dumps(..., indent=2) of the manifest; names are plain slugs, so no escaping
+_PACKAGE_JSON_TEMPLATE = '''{{
+  "name": "{name}",
+  "version": "1.0.0",
+  "description": "{template} project",
+  "main": "src/index.js",
+  "scripts": {{
+    "test": "jest",
+    "build": "webpack",
+    "start": "node src/index.js"
+  }},
+  "dependencies": {{
+    "express": "^4.18.0",
+    "lodash": "^4.17.21"
+  }},
+  "devDependencies": {{
+    "jest": "^29.0.0",
+    "webpack": "^5.75.0"
+  }}
+}}'''
+
+_SETUP_PY_TEMPLATE = '''from setuptools import setup, find_packages
+
+setup(
+    name="{name}",
+    version="1.0.0",
+    description="{template} project",
+    packages=find_packages(),
+    install_requires=[
+        "requests>=2.28.0",
+        "pydantic>=1.10.0",
+    ],
+    python_requires=">=3.8",
+)
+'''
+
+_GO_MOD_TEMPLATE = '''module github.com/example/{name}
+
+go 1.19
+
+require (
+    github.com/gin-gonic/gin v1.9.0
+    github.com/stretchr/testify v1.8.1
+)
+'''
+
+_CARGO_TOML_TEMPLATE = '''[package]
+name = "{name}"
+version = "1.0.0"
+edition = "2021"
+
+[dependencies]
+tokio = {{ version = "1.25", features = ["full"] }}
+serde = {{ version = "1.0", features = ["derive"] }}
+'''
+
+_POM_XML_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+    <modelVersion>4.0.0</modelVersion>
+    <groupId>com.example</groupId>
+    <artifactId>{name}</artifactId>
+    <version>1.0.0</version>
+    <dependencies>
+        <dependency>
+            <groupId>org.springframework.boot</groupId>
+            <artifactId>spring-boot-starter-web</artifactId>
+            <version>3.0.0</version>
+        </dependency>
+    </dependencies>
+</project>
+'''
+
+_K8S_DEPLOYMENT_TEMPLATE = '''apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: {name}
+spec:
+  replicas: 3
+  selector:
+    matchLabels:
+      app: {name}
+  template:
+    metadata:
+      labels:
+        app: {name}
+    spec:
+      containers:
+      - name: app
+        image: {name}:latest
+        ports:
+        - containerPort: 8000
+'''
+
+_K8S_SERVICE_TEMPLATE = '''apiVersion: v1
+kind: Service
+metadata:
+  name: {name}
+spec:
+  selector:
+    app: {name}
+  ports:
+  - port: 80
+    targetPort: 8000
+  type: LoadBalancer
+'''
+
+_README_TEMPLATE = '''# {name}
+
+{template} implementation
+
+## Features
+
+- Feature 1
+- Feature 2
+- Feature 3
+
+## Installation
+
+```bash
+# Install dependencies
+npm install  # or pip install -r requirements.txt
+```
+
+## Usage
+
+```bash
+# Run the application
+npm start
+```
+
+## Testing
+
+```bash
+# Run tests
+npm test
+```
+
+## License
+
+MIT
+'''
+
+
+def _compile_template(template: str) -> Tuple[str, ...]:
+    """Pre-split a template on its {i} slots so rendering is a single str(i).join(parts)"""
+    return tuple(template.split('{i}'))
+
+
+# Per-class/function templates; the *_BUG variants carry the injected 10% bug
+_PY_CLASS_TEMPLATE = (
+    'class Component{i}:\n'
+    '    """Class for component {i}"""\n'
+    '    \n'
+    '    def __init__(self, config: dict):\n'
+    '        self.config = config\n'
+    '        self.initialized = False\n'
+    '    \n'
+    '    def initialize(self):\n'
+    '        """Initialize component"""\n'
+    '        logger.info("Initializing component")\n'
+    '        self.initialized = True\n'
+    '    \n'
+    '    def process(self, data: typing.Any) -> typing.Any:\n'
+    '        """Process data"""\n'
+    '        if not self.initialized:\n'
+    '            raise RuntimeError("Component not initialized")\n'
+    '        \n'
+    '        result = self._transform(data)\n'
+    '        return result\n'
+    '    \n'
+    '    def _transform(self, data: typing.Any) -> typing.Any:\n'
+    '        """Internal transformation logic"""\n'
+    '        # TODO: Implement transformation\n'
+)
+_PY_CLASS_TEMPLATE_OK = _compile_template(_PY_CLASS_TEMPLATE + '        return data\n')
+_PY_CLASS_TEMPLATE_BUG = _compile_template(
+    _PY_CLASS_TEMPLATE + '        return data + None  # BUG: TypeError\n')
+
+_PY_FUNCTION_TEMPLATE = _compile_template(
+    'def function_{i}(param1: str, param2: int = 0) -> dict:\n'
+    '    """Function {i} description"""\n'
+    '    result = {\n'
+    '        "param1": param1,\n'
+    '        "param2": param2,\n'
+    '        "timestamp": datetime.now().isoformat()\n'
+    '    }\n'
+    '    return result\n'
+)
+
+_JS_CLASS_OPEN = (
+    'class Service{i} {\n'
+    '  constructor(config) {\n'
+)
+_TS_CLASS_OPEN = (
+    'export class Service{i} implements Component {\n'
+    '  private initialized: boolean = false;\n'
+    '  private config: Record<string, any>;\n'
+    '\n'
+    '  constructor(config: Record<string, any>) {\n'
+)
+_JS_CLASS_BODY = (
+    '    this.config = config;\n'
+    '  }\n'
+    '\n'
+    '  async initialize() {\n'
+    '    console.log("Initializing service");\n'
+    '    this.initialized = true;\n'
+    '  }\n'
+    '\n'
+    '  async process(data) {\n'
+    '    if (!this.initialized) {\n'
+    '      throw new Error("Service not initialized");\n'
+    '    }\n'
+    '    const result = await this.transform(data);\n'
+    '    return result;\n'
+    '  }\n'
+    '\n'
+    '  async transform(data) {\n'
+)
+_JS_TRANSFORM_OK = '    return { ...data, processed: true };\n  }\n}\n'
+_JS_TRANSFORM_BUG = '    return data.nonexistent.property;  // BUG: Cannot read property\n  }\n}\n'
+
+# (ok, bug) class templates keyed by "is TypeScript"
+_JS_CLASS_TEMPLATES = {
+    is_ts: (_compile_template(opening + _JS_CLASS_BODY + _JS_TRANSFORM_OK),
+            _compile_template(opening + _JS_CLASS_BODY + _JS_TRANSFORM_BUG))
+    for is_ts, opening in ((False, _JS_CLASS_OPEN), (True, _TS_CLASS_OPEN))
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _python_skeleton(code_type: str, num_classes: int,
+                     num_functions: int) -> Tuple[str, Tuple[str, ...], str]:
+    """Build the bug-free header, class bodies and function block of a Python module"""
+    head = f'"""\nModule for {code_type}\n"""\n\n' + _PY_HEADER
+    classes = tuple(str(i).join(_PY_CLASS_TEMPLATE_OK) for i in range(num_classes))
+    functions = '\n'.join([str(i).join(_PY_FUNCTION_TEMPLATE) for i in range(num_functions)])
+    return head, classes, functions
+
+
+@functools.lru_cache(maxsize=4096)
+def _js_skeleton(language: str, num_classes: int) -> Tuple[str, Tuple[str, ...]]:
+    """Build the bug-free header and class bodies of a JavaScript/TypeScript module"""
+    is_ts = language == 'typescript'
+    if is_ts:
+        head = 'import { Component } from "./types";\n'
+    else:
+        head = 'const Component = require("./component");\n'
+
+    template = _JS_CLASS_TEMPLATES[is_ts][0]
+    return head, tuple(str(i).join(template) for i in range(num_classes))
+
+
+_RUST_TEMPLATE = '''use std::collections::HashMap;
+use chrono::Utc;
+
+pub struct Component {
+    config: HashMap<String, String>,
+    initialized: bool,
+}
+
+impl Component {
+    pub fn new(config: HashMap<String, String>) -> Self {
+        Component {
+            config,
+            initialized: false,
+        }
+    }
+
+    pub fn initialize(&mut self) {
+        println!("Initializing component");
+        self.initialized = true;
+    }
+
+    pub fn process(&self, data: &str) -> Result<HashMap<String, String>, String> {
+        if !self.initialized {
+            return Err("Component not initialized".to_string());
+        }
+        self.transform(data)
+    }
+
+    fn transform(&self, data: &str) -> Result<HashMap<String, String>, String> {
+        let mut result = HashMap::new();
+        result.insert("data".to_string(), data.to_string());
+        result.insert("timestamp".to_string(), Utc::now().to_rfc3339());
+        Ok(result)
+    }
+}'''
+
+
+_JAVA_TEMPLATE = '''package com.example.app;
+
+import java.util.*;
+import java.time.LocalDateTime;
+
+public class Component {
+    private Map<String, Object> config;
+    private boolean initialized;
+
+    public Component(Map<String, Object> config) {
+        this.config = config;
+        this.initialized = false;
+    }
+
+    public void initialize() {
+        System.out.println("Initializing component");
+        this.initialized = true;
+    }
+
+    public Map<String, Object> process(Object data) {
+        if (!initialized) {
+            throw new RuntimeException("Component not initialized");
+        }
+        return transform(data);
+    }
+
+    private Map<String, Object> transform(Object data) {
+        Map<String, Object> result = new HashMap<>();
+        result.put("data", data);
+        result.put("timestamp", LocalDateTime.now());
+        return result;
+    }
+}'''
+
+_GO_TEMPLATE = '''package main
+
+import (
+    "fmt"
+    "time"
+)
+
+type Component struct {
+    Config      map[string]interface{}
+    Initialized bool
+}
+
+func NewComponent(config map[string]interface{}) *Component {
+    return &Component{
+        Config:      config,
+        Initialized: false,
+    }
+}
+
+func (c *Component) Initialize() {
+    fmt.Println("Initializing component")
+    c.Initialized = true
+}
+
+func (c *Component) Process(data interface{}) (map[string]interface{}, error) {
+    if !c.Initialized {
+        return nil, fmt.Errorf("component not initialized")
+    }
+    return c.transform(data)
+}
+
+func (c *Component) transform(data interface{}) (map[string]interface{}, error) {
+    result := map[string]interface{}{
+        "data":      data,
+        "timestamp": time.Now(),
+    }
+    return result, nil
+}'''
+
+
+@functools.lru_cache(maxsize=32)
+def _generic_source(lines: int) -> str:
+    """Build `lines` placeholder comment lines; the loop runs in C via map/join"""
+    return '\n'.join(map('// Line %d'.__mod__, range(lines)))
+
+
+class RepoGenerator:
+    """Generates realistic repository, committed to git (full history when want_history is set)"""
+
+    __slots__ = (
+        'repo_id', 'category', 'template', 'base_path', 'repo_name', 'repo_path',
+        'language', 'lines_of_code', 'num_commits', 'num_contributors', 'contributors',
+        'test_coverage', 'emit_tar', 'want_history',
+        '_codegen', '_pending_writes', '_mkdir_cache', '_written_files', '_file_data', '_tar',
+        '_rng', '_rng_ints', '_rng_i',
+    )
+
+    # Leaf directories per project layout; parents are created implicitly
+    WEB_DIRS = ('src/components', 'src/pages', 'src/utils', 'src/api', 'src/models', 'src/services',
+                'tests/unit', 'tests/integration', 'tests/e2e', 'config', 'public', 'static')
+    MICROSERVICE_DIRS = ('shared/models', 'shared/utils', 'infrastructure/k8s', 'infrastructure/terraform')
+    SERVICE_DIRS = ('src', 'tests', 'config')
+    CLI_DIRS = ('cmd', 'internal', 'pkg', 'tests')
+    LIBRARY_DIRS = ('src', 'tests', 'examples', 'docs', 'benchmarks')
+    IOS_DIRS = ('Sources', 'Tests', 'Resources')
+    ANDROID_DIRS = ('app/src/main/java', 'app/src/test/java', 'app/src/main/res')
+    GAME_DIRS = ('Assets/Scripts', 'Assets/Scenes', 'Assets/Prefabs', 'Assets/Materials', 'Tests')
+    DATA_DIRS = ('pipelines', 'transformations', 'models', 'schemas', 'tests', 'config')
+    ENTERPRISE_DIRS = ('backend/src', 'backend/tests', 'frontend/src', 'frontend/tests',
+                       'database/migrations', 'docs', 'infrastructure')
+    CONFIG_DIRS = ('.github/workflows',)
+
+    def __init__(self, repo_id: int, category: str, template: str, base_path: str, emit_tar: bool = False,
+                 want_history: bool = False):
         self.repo_id = repo_id
         self.category = category
         self.template = template
         self.base_path = Path(base_path)
         self.repo_name = f"repo-{repo_id:05d}-{template}"
         self.repo_path = self.base_path / self.repo_name
+
+        # Per-repo generator for every random choice, so a repository depends only on its id
+        self._rng = random.Random(repo_id)
+        self._rng_ints = array('I')
+        self._rng_i = 0
+
         self.language = self._select_language()
-        self.lines_of_code = random.randint(1000, 50000)
-        self.num_commits = random.randint(100, 500)
-        self.num_contributors = random.randint(1, min(5, len(CONTRIBUTORS)))
-        self.contributors = random.sample(CONTRIBUTORS, self.num_contributors)
-        self.test_coverage = random.randint(20, 90)
+        self.lines_of_code = self._rng.randint(1000, 50000)
+        self.num_commits = self._rng.randint(100, 500)
+        self.num_contributors = self._rng.randint(1, min(5, len(CONTRIBUTORS)))
+        self.contributors = self._rng.sample(CONTRIBUTORS, self.num_contributors)
+        self.test_coverage = self._rng.randint(20, 90)
+
+        # Code generator per language; anything else falls back to _generate_generic_code
+        self._codegen = {
+            'python': self._generate_python_code,
+            'javascript': self._generate_js_code,
+            'typescript': self._generate_js_code,
+            'java': self._generate_java_code,
+            'go': self._generate_go_code,
+            'rust': self._generate_rust_code,
+        }
+
+        # (path, content) pairs queued by _write_file until _flush_writes
+        self._pending_writes = []
+
+        # Directories known to exist, so repeated writes into them skip the mkdir syscall
+        self._mkdir_cache = set()
+
+        # Repo-relative paths of every file written, in write order (feeds the commit history)
+        self._written_files = []
+
+        # Encoded contents by repo-relative path, filled by _flush_writes; _fast_import streams
+        # blobs from here instead of stat-ing and re-reading the tree it just wrote
+        self._file_data = {}
+
+        # Tarball mode streams every file into <repo>.tar instead of a git working tree
+        self.emit_tar = emit_tar
+        self._tar = None
+
+        # Full multi-commit history is opt-in; otherwise the tree lands in one initial commit
+        self.want_history = want_history
+
+    def _randint(self, lo: int, hi: int) -> int:
+        """Return a random integer in [lo, hi] from the pre-drawn batch"""
+        if self._rng_i == len(self._rng_ints):
+            self._rng_ints = array('I', self._rng.randbytes(_RNG_BATCH * self._rng_ints.itemsize))
+            self._rng_i = 0
+        value = self._rng_ints[self._rng_i]
+        self._rng_i += 1
+        return lo + value % (hi - lo + 1)
 
     def _select_language(self) -> str:
         """Select language based on weights"""
-        weights = [LANGUAGES[lang]['weight'] for lang in LANGUAGES]
-        return random.choices(list(LANGUAGES.keys()), weights=weights)[0]
+        return self._rng.choices(_LANG_KEYS, weights=_LANG_WEIGHTS)[0]
 
     def generate(self):
         """Generate complete repository"""
+        # Resuming an interrupted run: leave repositories that already exist untouched
+        if not self.emit_tar and (self.repo_path / '.git').exists():
+            print(f"[{self.repo_id}] - Skipping {self.repo_name} (already exists)")
+            return
+
         print(f"[{self.repo_id}] Generating {self.repo_name} ({self.language})...")
 
+        if self.emit_tar:
+            self._generate_tarball()
+            print(f"[{self.repo_id}] ✓ Generated {self.repo_name}.tar")
+            return
+
         # Create directory
         self.repo_path.mkdir(parents=True, exist_ok=True)
-        os.chdir(self.repo_path)
 
-        # Initialize git
-        subprocess.run(['git', 'init'], capture_output=True)
-        subprocess.run(['git', 'config', 'user.name', self.contributors[0][0]], capture_output=True)
-        subprocess.run(['git', 'config', 'user.email', self.contributors[0][1]], capture_output=True)
+        # Initialize git: copy the shared template when available, else fork `git init`
+        if _GIT_TEMPLATE:
+            shutil.copytree(_GIT_TEMPLATE, self.repo_path / '.git')
+        else:
+            self._git('init')
+
+        # Write the default identity straight into .git/config instead of forking `git config`
+        name, email = self.contributors[0]
+        with open(self.repo_path / '.git' / 'config', 'a') as f:
+            f.write(f'[user]\n\tname = {name}\n\temail = {email}\n')
 
-        # Generate repository structure
+        # Generate repository structure, then write every queued file in one batch
         self._generate_structure()
+        self._flush_writes()
 
-        # Create realistic commit history
-        self._create_commit_history()
+        # Create realistic commit history, or just snapshot the tree
+        if self.want_history:
+            self._create_commit_history()
+        else:
+            self._create_initial_commit()
 
         print(f"[{self.repo_id}] ✓ Generated {self.repo_name}")
 
+    def _generate_tarball(self):
+        """Write the file tree into a single tarball (no git history, no working tree)"""
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        with open(f'{self.repo_path}.tar', 'wb', buffering=1 << 20) as f:
+            with tarfile.open(fileobj=f, mode='w') as self._tar:
+                self._generate_structure()
+                self._flush_writes()
+        self._tar = None
+
+    def _git(self, *args: str, **kwargs) -> subprocess.CompletedProcess:
+        """Run git inside this repository; cwd is always explicit, never os.chdir"""
+        # Output is never read, so discard it rather than piping it back into Python;
+        # callers that need the error text pass stderr=subprocess.PIPE
+        kwargs.setdefault('stderr', subprocess.DEVNULL)
+        return subprocess.run(['git', *_GIT_FAST_CONFIG, *args], stdout=subprocess.DEVNULL,
+                              cwd=self.repo_path, **kwargs)
+
     def _generate_structure(self):
         """Generate project structure based on template"""
         if 'web' in self.template or 'framework' in self.template:
@@ -198,183 +846,122 @@ class RepoGenerator:
         else:
             self._generate_enterprise_structure()
 
-    def _generate_web_structure(self):
-        """Generate web application structure"""
-        # Source files
-        (self.repo_path / 'src').mkdir()
-        (self.repo_path / 'src' / 'components').mkdir()
-        (self.repo_path / 'src' / 'pages').mkdir()
-        (self.repo_path / 'src' / 'utils').mkdir()
-        (self.repo_path / 'src' / 'api').mkdir()
-        (self.repo_path / 'src' / 'models').mkdir()
-        (self.repo_path / 'src' / 'services').mkdir()
+    def _make_dirs(self, leaves: Tuple[str, ...], root: Optional[Path] = None):
+        """Create leaf directories; intermediate parents are created implicitly"""
+        if self.emit_tar:
+            return  # tar members carry their own paths
 
-        # Tests
-        (self.repo_path / 'tests').mkdir()
-        (self.repo_path / 'tests' / 'unit').mkdir()
-        (self.repo_path / 'tests' / 'integration').mkdir()
-        (self.repo_path / 'tests' / 'e2e').mkdir()
-
-        # Config
-        (self.repo_path / 'config').mkdir()
-
-        # Public/Static
-        (self.repo_path / 'public').mkdir()
-        (self.repo_path / 'static').mkdir()
+        root = root or self.repo_path
+        for leaf in leaves:
+            path = root / leaf
+            path.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(path)
+            self._mkdir_cache.update(path.parents)
 
+    def _generate_web_structure(self):
+        """Generate web application structure"""
+        self._make_dirs(self.WEB_DIRS)
         self._create_web_files()
 
     def _generate_microservice_structure(self):
         """Generate microservice architecture"""
         num_services = 10 if 'small' in self.category else (50 if 'medium' in self.category else 100)
 
+        self._make_dirs(self.MICROSERVICE_DIRS)
+
         # API Gateway
-        (self.repo_path / 'api-gateway').mkdir()
         self._create_service_files(self.repo_path / 'api-gateway', 'gateway')
 
         # Services
-        services = ['auth', 'user', 'product', 'order', 'payment', 'inventory',
-                   'notification', 'analytics', 'search', 'recommendation']
-
-        for i in range(min(num_services, 100)):
-            service_name = services[i % len(services)] + (f'-{i//len(services)}' if i >= len(services) else '')
-            service_path = self.repo_path / 'services' / service_name
-            service_path.mkdir(parents=True)
-            self._create_service_files(service_path, service_name)
-
-        # Shared
-        (self.repo_path / 'shared').mkdir()
-        (self.repo_path / 'shared' / 'models').mkdir()
-        (self.repo_path / 'shared' / 'utils').mkdir()
+        for service_name in _MS_NAMES_100[:num_services]:
+            self._create_service_files(self.repo_path / 'services' / service_name, service_name)
 
         # Infrastructure
-        (self.repo_path / 'infrastructure').mkdir()
         self._create_infrastructure_files()
 
     def _generate_cli_structure(self):
         """Generate CLI tool structure"""
-        (self.repo_path / 'cmd').mkdir()
-        (self.repo_path / 'internal').mkdir()
-        (self.repo_path / 'pkg').mkdir()
-        (self.repo_path / 'tests').mkdir()
-
+        self._make_dirs(self.CLI_DIRS)
         self._create_cli_files()
 
     def _generate_library_structure(self):
         """Generate library structure"""
-        (self.repo_path / 'src').mkdir()
-        (self.repo_path / 'tests').mkdir()
-        (self.repo_path / 'examples').mkdir()
-        (self.repo_path / 'docs').mkdir()
-        (self.repo_path / 'benchmarks').mkdir()
-
+        self._make_dirs(self.LIBRARY_DIRS)
         self._create_library_files()
 
     def _generate_mobile_structure(self):
         """Generate mobile app structure"""
         if 'ios' in self.category:
-            (self.repo_path / 'Sources').mkdir()
-            (self.repo_path / 'Tests').mkdir()
-            (self.repo_path / 'Resources').mkdir()
+            self._make_dirs(self.IOS_DIRS)
             self._create_ios_files()
         else:
-            (self.repo_path / 'app').mkdir()
-            (self.repo_path / 'app' / 'src' / 'main' / 'java').mkdir(parents=True)
-            (self.repo_path / 'app' / 'src' / 'test' / 'java').mkdir(parents=True)
-            (self.repo_path / 'app' / 'src' / 'main' / 'res').mkdir(parents=True)
+            self._make_dirs(self.ANDROID_DIRS)
             self._create_android_files()
 
     def _generate_game_structure(self):
         """Generate game project structure"""
-        (self.repo_path / 'Assets').mkdir()
-        (self.repo_path / 'Assets' / 'Scripts').mkdir()
-        (self.repo_path / 'Assets' / 'Scenes').mkdir()
-        (self.repo_path / 'Assets' / 'Prefabs').mkdir()
-        (self.repo_path / 'Assets' / 'Materials').mkdir()
-        (self.repo_path / 'Tests').mkdir()
-
+        self._make_dirs(self.GAME_DIRS)
         self._create_game_files()
 
     def _generate_data_structure(self):
         """Generate data engineering structure"""
-        (self.repo_path / 'pipelines').mkdir()
-        (self.repo_path / 'transformations').mkdir()
-        (self.repo_path / 'models').mkdir()
-        (self.repo_path / 'schemas').mkdir()
-        (self.repo_path / 'tests').mkdir()
-        (self.repo_path / 'config').mkdir()
-
+        self._make_dirs(self.DATA_DIRS)
         self._create_data_files()
 
     def _generate_enterprise_structure(self):
         """Generate enterprise application structure"""
-        (self.repo_path / 'backend').mkdir()
-        (self.repo_path / 'backend' / 'src').mkdir()
-        (self.repo_path / 'backend' / 'tests').mkdir()
-
-        (self.repo_path / 'frontend').mkdir()
-        (self.repo_path / 'frontend' / 'src').mkdir()
-        (self.repo_path / 'frontend' / 'tests').mkdir()
-
-        (self.repo_path / 'database').mkdir()
-        (self.repo_path / 'database' / 'migrations').mkdir()
-
-        (self.repo_path / 'docs').mkdir()
-        (self.repo_path / 'infrastructure').mkdir()
-
+        self._make_dirs(self.ENTERPRISE_DIRS)
         self._create_enterprise_files()
 
     def _create_web_files(self):
         """Create web application files"""
-        ext = LANGUAGES[self.language]['extensions'][0]
+        ext = _LANG_EXT[self.language]
 
         # Main app file
-        self._write_code_file(f'src/app{ext}', self._generate_code(500, 'app_entry'))
-        self._write_code_file(f'src/index{ext}', self._generate_code(50, 'index'))
+        self._write_file(f'src/app{ext}', self._generate_code(500, 'app_entry'))
+        self._write_file(f'src/index{ext}', self._generate_code(50, 'index'))
 
         # Components
-        for i in range(random.randint(10, 30)):
-            self._write_code_file(f'src/components/Component{i}{ext}',
-                                self._generate_code(random.randint(50, 300), 'component'))
+        for i in range(self._randint(10, 30)):
+            self._write_file(f'src/components/Component{i}{ext}',
+                             self._generate_code(self._randint(50, 300), 'component'))
 
         # Pages
-        for i in range(random.randint(5, 15)):
-            self._write_code_file(f'src/pages/Page{i}{ext}',
-                                self._generate_code(random.randint(100, 500), 'page'))
+        for i in range(self._randint(5, 15)):
+            self._write_file(f'src/pages/Page{i}{ext}',
+                             self._generate_code(self._randint(100, 500), 'page'))
 
         # Utils
-        for i in range(random.randint(5, 15)):
-            self._write_code_file(f'src/utils/util{i}{ext}',
-                                self._generate_code(random.randint(50, 200), 'util'))
+        for i in range(self._randint(5, 15)):
+            self._write_file(f'src/utils/util{i}{ext}',
+                             self._generate_code(self._randint(50, 200), 'util'))
 
         # API
-        for i in range(random.randint(5, 15)):
-            self._write_code_file(f'src/api/api{i}{ext}',
-                                self._generate_code(random.randint(100, 300), 'api'))
+        for i in range(self._randint(5, 15)):
+            self._write_file(f'src/api/api{i}{ext}',
+                             self._generate_code(self._randint(100, 300), 'api'))
 
         # Tests
-        for i in range(random.randint(20, 60)):
-            self._write_code_file(f'tests/unit/test{i}{ext}',
-                                self._generate_code(random.randint(50, 200), 'test'))
+        for i in range(self._randint(20, 60)):
+            self._write_file(f'tests/unit/test{i}{ext}',
+                             self._generate_code(self._randint(50, 200), 'test'))
 
         self._create_config_files()
 
     def _create_service_files(self, path: Path, service_name: str):
         """Create microservice files"""
-        ext = LANGUAGES[self.language]['extensions'][0]
+        ext = _LANG_EXT[self.language]
 
-        (path / 'src').mkdir(exist_ok=True)
-        (path / 'tests').mkdir(exist_ok=True)
-        (path / 'config').mkdir(exist_ok=True)
+        self._make_dirs(self.SERVICE_DIRS, path)
 
-        self._write_code_file(f'{path}/src/main{ext}', self._generate_code(200, 'service_main'))
-        self._write_code_file(f'{path}/src/handlers{ext}', self._generate_code(300, 'handlers'))
-        self._write_code_file(f'{path}/src/models{ext}', self._generate_code(150, 'models'))
-        self._write_code_file(f'{path}/src/repository{ext}', self._generate_code(200, 'repository'))
+        self._write_file(f'{path}/src/main{ext}', self._generate_code(200, 'service_main'))
+        self._write_file(f'{path}/src/handlers{ext}', self._generate_code(300, 'handlers'))
+        self._write_file(f'{path}/src/models{ext}', self._generate_code(150, 'models'))
+        self._write_file(f'{path}/src/repository{ext}', self._generate_code(200, 'repository'))
 
-        for i in range(random.randint(5, 15)):
-            self._write_code_file(f'{path}/tests/test{i}{ext}',
-                                self._generate_code(random.randint(50, 150), 'test'))
+        for i in range(self._randint(5, 15)):
+            self._write_file(f'{path}/tests/test{i}{ext}',
+                             self._generate_code(self._randint(50, 150), 'test'))
 
     def _create_infrastructure_files(self):
         """Create infrastructure files"""
@@ -384,104 +971,102 @@ class RepoGenerator:
 
         # Kubernetes
         k8s_path = self.repo_path / 'infrastructure' / 'k8s'
-        k8s_path.mkdir(parents=True, exist_ok=True)
         self._write_file(f'{k8s_path}/deployment.yaml', self._generate_k8s_deployment())
         self._write_file(f'{k8s_path}/service.yaml', self._generate_k8s_service())
 
         # Terraform
         tf_path = self.repo_path / 'infrastructure' / 'terraform'
-        tf_path.mkdir(parents=True, exist_ok=True)
         self._write_file(f'{tf_path}/main.tf', self._generate_terraform())
 
     def _create_cli_files(self):
         """Create CLI tool files"""
-        ext = LANGUAGES[self.language]['extensions'][0]
+        ext = _LANG_EXT[self.language]
 
-        self._write_code_file(f'cmd/main{ext}', self._generate_code(300, 'cli_main'))
-        self._write_code_file(f'internal/commands{ext}', self._generate_code(500, 'commands'))
-        self._write_code_file(f'internal/config{ext}', self._generate_code(150, 'config'))
-        self._write_code_file(f'pkg/utils{ext}', self._generate_code(200, 'utils'))
+        self._write_file(f'cmd/main{ext}', self._generate_code(300, 'cli_main'))
+        self._write_file(f'internal/commands{ext}', self._generate_code(500, 'commands'))
+        self._write_file(f'internal/config{ext}', self._generate_code(150, 'config'))
+        self._write_file(f'pkg/utils{ext}', self._generate_code(200, 'utils'))
 
-        for i in range(random.randint(10, 30)):
-            self._write_code_file(f'tests/test{i}{ext}',
-                                self._generate_code(random.randint(50, 150), 'test'))
+        for i in range(self._randint(10, 30)):
+            self._write_file(f'tests/test{i}{ext}',
+                             self._generate_code(self._randint(50, 150), 'test'))
 
     def _create_library_files(self):
         """Create library files"""
-        ext = LANGUAGES[self.language]['extensions'][0]
+        ext = _LANG_EXT[self.language]
 
-        self._write_code_file(f'src/core{ext}', self._generate_code(1000, 'library_core'))
+        self._write_file(f'src/core{ext}', self._generate_code(1000, 'library_core'))
 
-        for i in range(random.randint(10, 30)):
-            self._write_code_file(f'src/module{i}{ext}',
-                                self._generate_code(random.randint(100, 500), 'module'))
+        for i in range(self._randint(10, 30)):
+            self._write_file(f'src/module{i}{ext}',
+                             self._generate_code(self._randint(100, 500), 'module'))
 
-        for i in range(random.randint(20, 60)):
-            self._write_code_file(f'tests/test{i}{ext}',
-                                self._generate_code(random.randint(50, 200), 'test'))
+        for i in range(self._randint(20, 60)):
+            self._write_file(f'tests/test{i}{ext}',
+                             self._generate_code(self._randint(50, 200), 'test'))
 
-        for i in range(random.randint(5, 10)):
-            self._write_code_file(f'examples/example{i}{ext}',
-                                self._generate_code(random.randint(50, 150), 'example'))
+        for i in range(self._randint(5, 10)):
+            self._write_file(f'examples/example{i}{ext}',
+                             self._generate_code(self._randint(50, 150), 'example'))
 
     def _create_ios_files(self):
         """Create iOS app files"""
-        for i in range(random.randint(10, 30)):
-            self._write_code_file(f'Sources/View{i}.swift',
-                                self._generate_code(random.randint(50, 200), 'swift_view'))
+        for i in range(self._randint(10, 30)):
+            self._write_file(f'Sources/View{i}.swift',
+                             self._generate_code(self._randint(50, 200), 'swift_view'))
 
-        for i in range(random.randint(10, 20)):
-            self._write_code_file(f'Tests/Test{i}.swift',
-                                self._generate_code(random.randint(50, 150), 'swift_test'))
+        for i in range(self._randint(10, 20)):
+            self._write_file(f'Tests/Test{i}.swift',
+                             self._generate_code(self._randint(50, 150), 'swift_test'))
 
     def _create_android_files(self):
         """Create Android app files"""
         base = 'app/src/main/java/com/example/app'
-        for i in range(random.randint(10, 30)):
-            self._write_code_file(f'{base}/Activity{i}.kt',
-                                self._generate_code(random.randint(50, 200), 'kotlin_activity'))
+        for i in range(self._randint(10, 30)):
+            self._write_file(f'{base}/Activity{i}.kt',
+                             self._generate_code(self._randint(50, 200), 'kotlin_activity'))
 
         test_base = 'app/src/test/java/com/example/app'
-        for i in range(random.randint(10, 20)):
-            self._write_code_file(f'{test_base}/Test{i}.kt',
-                                self._generate_code(random.randint(50, 150), 'kotlin_test'))
+        for i in range(self._randint(10, 20)):
+            self._write_file(f'{test_base}/Test{i}.kt',
+                             self._generate_code(self._randint(50, 150), 'kotlin_test'))
 
     def _create_game_files(self):
         """Create game files"""
-        for i in range(random.randint(20, 50)):
-            self._write_code_file(f'Assets/Scripts/Script{i}.cs',
-                                self._generate_code(random.randint(50, 300), 'game_script'))
+        for i in range(self._randint(20, 50)):
+            self._write_file(f'Assets/Scripts/Script{i}.cs',
+                             self._generate_code(self._randint(50, 300), 'game_script'))
 
     def _create_data_files(self):
         """Create data engineering files"""
-        ext = LANGUAGES[self.language]['extensions'][0]
+        ext = _LANG_EXT[self.language]
 
-        for i in range(random.randint(5, 15)):
-            self._write_code_file(f'pipelines/pipeline{i}{ext}',
-                                self._generate_code(random.randint(200, 600), 'pipeline'))
+        for i in range(self._randint(5, 15)):
+            self._write_file(f'pipelines/pipeline{i}{ext}',
+                             self._generate_code(self._randint(200, 600), 'pipeline'))
 
-        for i in range(random.randint(10, 20)):
-            self._write_code_file(f'transformations/transform{i}{ext}',
-                                self._generate_code(random.randint(100, 300), 'transform'))
+        for i in range(self._randint(10, 20)):
+            self._write_file(f'transformations/transform{i}{ext}',
+                             self._generate_code(self._randint(100, 300), 'transform'))
 
     def _create_enterprise_files(self):
         """Create enterprise application files"""
-        ext = LANGUAGES[self.language]['extensions'][0]
+        ext = _LANG_EXT[self.language]
 
         # Backend
-        for i in range(random.randint(20, 50)):
-            self._write_code_file(f'backend/src/module{i}{ext}',
-                                self._generate_code(random.randint(100, 500), 'backend'))
+        for i in range(self._randint(20, 50)):
+            self._write_file(f'backend/src/module{i}{ext}',
+                             self._generate_code(self._randint(100, 500), 'backend'))
 
         # Frontend
-        for i in range(random.randint(20, 50)):
-            self._write_code_file(f'frontend/src/component{i}{ext}',
-                                self._generate_code(random.randint(100, 400), 'frontend'))
+        for i in range(self._randint(20, 50)):
+            self._write_file(f'frontend/src/component{i}{ext}',
+                             self._generate_code(self._randint(100, 400), 'frontend'))
 
         # Database
-        for i in range(random.randint(10, 30)):
+        for i in range(self._randint(10, 30)):
             self._write_file(f'database/migrations/migration{i:03d}.sql',
-                           self._generate_sql_migration())
+                             self._generate_sql_migration())
 
     def _create_config_files(self):
         """Create configuration files"""
@@ -501,592 +1086,161 @@ class RepoGenerator:
             self._write_file('pom.xml', self._generate_pom_xml())
 
         # CI/CD
-        (self.repo_path / '.github' / 'workflows').mkdir(parents=True, exist_ok=True)
-        self._write_file('.github/workflows/ci.yml', self._generate_github_actions())
+        self._make_dirs(self.CONFIG_DIRS)
+        self._write_file('.github/workflows/ci.yml', _GITHUB_ACTIONS_CI_BYTES)
 
         # Git
-        self._write_file('.gitignore', self._generate_gitignore())
+        self._write_file('.gitignore', _GITIGNORE_BYTES)
 
         # README
         self._write_file('README.md', self._generate_readme())
 
         # License
-        self._write_file('LICENSE', self._generate_license())
+        self._write_file('LICENSE', _LICENSE_MIT_BYTES)
 
     def _generate_code(self, lines: int, code_type: str) -> str:
         """Generate realistic code based on language"""
-        if self.language == 'python':
-            return self._generate_python_code(lines, code_type)
-        elif self.language in ['javascript', 'typescript']:
-            return self._generate_js_code(lines, code_type)
-        elif self.language == 'java':
-            return self._generate_java_code(lines, code_type)
-        elif self.language == 'go':
-            return self._generate_go_code(lines, code_type)
-        elif self.language == 'rust':
-            return self._generate_rust_code(lines, code_type)
-        else:
-            return self._generate_generic_code(lines)
+        return self._codegen.get(self.language, self._generate_generic_code)(lines, code_type)
 
     def _generate_python_code(self, lines: int, code_type: str) -> str:
         """Generate Python code"""
-        code = []
-        code.append('"""')
-        code.append(f'Module for {code_type}')
-        code.append('"""')
-        code.append('')
-        code.append('import logging')
-        code.append('import typing')
-        code.append('from datetime import datetime')
-        code.append('')
-        code.append('logger = logging.getLogger(__name__)')
-        code.append('')
-
-        num_classes = max(1, lines // 50)
-        for i in range(num_classes):
-            code.append(f'class Component{i}:')
-            code.append(f'    """Class for component {i}"""')
-            code.append('    ')
-            code.append('    def __init__(self, config: dict):')
-            code.append('        self.config = config')
-            code.append('        self.initialized = False')
-            code.append('    ')
-            code.append('    def initialize(self):')
-            code.append('        """Initialize component"""')
-            code.append('        logger.info("Initializing component")')
-            code.append('        self.initialized = True')
-            code.append('    ')
-            code.append('    def process(self, data: typing.Any) -> typing.Any:')
-            code.append('        """Process data"""')
-            code.append('        if not self.initialized:')
-            code.append('            raise RuntimeError("Component not initialized")')
-            code.append('        ')
-            code.append('        result = self._transform(data)')
-            code.append('        return result')
-            code.append('    ')
-            code.append('    def _transform(self, data: typing.Any) -> typing.Any:')
-            code.append('        """Internal transformation logic"""')
-            code.append('        # TODO: Implement transformation')
-            if random.random() < 0.1:  # 10% chance of bug
-                code.append('        return data + None  # BUG: TypeError')
-            else:
-                code.append('        return data')
-            code.append('')
-
-        # Add some functions
-        num_functions = max(1, lines // 30)
-        for i in range(num_functions):
-            code.append(f'def function_{i}(param1: str, param2: int = 0) -> dict:')
-            code.append(f'    """Function {i} description"""')
-            code.append('    result = {')
-            code.append('        "param1": param1,')
-            code.append('        "param2": param2,')
-            code.append('        "timestamp": datetime.now().isoformat()')
-            code.append('    }')
-            code.append('    return result')
-            code.append('')
-
-        return '\n'.join(code)
+        head, classes, functions = _python_skeleton(code_type, max(1, lines // 50), max(1, lines // 30))
+        code = io.StringIO()
+        code.write(head)
+        for i, body in enumerate(classes):
+            if self._randint(0, 9) == 0:  # 10% chance of bug
+                body = str(i).join(_PY_CLASS_TEMPLATE_BUG)
+            code.write('\n')
+            code.write(body)
+        code.write('\n')
+        code.write(functions)
+        return code.getvalue()
 
     def _generate_js_code(self, lines: int, code_type: str) -> str:
         """Generate JavaScript/TypeScript code"""
-        is_ts = self.language == 'typescript'
-        code = []
-
-        if is_ts:
-            code.append('import { Component } from "./types";')
-        else:
-            code.append('const Component = require("./component");')
-
-        code.append('')
-
-        num_classes = max(1, lines // 50)
-        for i in range(num_classes):
-            if is_ts:
-                code.append(f'export class Service{i} implements Component {{')
-                code.append(f'  private initialized: boolean = false;')
-                code.append(f'  private config: Record<string, any>;')
-                code.append('')
-                code.append(f'  constructor(config: Record<string, any>) {{')
-            else:
-                code.append(f'class Service{i} {{')
-                code.append(f'  constructor(config) {{')
-
-            code.append('    this.config = config;')
-            code.append('  }')
-            code.append('')
-            code.append('  async initialize() {')
-            code.append('    console.log("Initializing service");')
-            code.append('    this.initialized = true;')
-            code.append('  }')
-            code.append('')
-            code.append('  async process(data) {')
-            code.append('    if (!this.initialized) {')
-            code.append('      throw new Error("Service not initialized");')
-            code.append('    }')
-            code.append('    const result = await this.transform(data);')
-            code.append('    return result;')
-            code.append('  }')
-            code.append('')
-            code.append('  async transform(data) {')
-            if random.random() < 0.1:  # 10% chance of bug
-                code.append('    return data.nonexistent.property;  // BUG: Cannot read property')
-            else:
-                code.append('    return { ...data, processed: true };')
-            code.append('  }')
-            code.append('}')
-            code.append('')
-
+        head, classes = _js_skeleton(self.language, max(1, lines // 50))
+        bug_template = _JS_CLASS_TEMPLATES[self.language == 'typescript'][1]
+        code = [head]
+        for i, body in enumerate(classes):
+            if self._randint(0, 9) == 0:  # 10% chance of bug
+                body = str(i).join(bug_template)
+            code.append(body)
         return '\n'.join(code)
 
     def _generate_java_code(self, lines: int, code_type: str) -> str:
         """Generate Java code"""
-        code = []
-        code.append('package com.example.app;')
-        code.append('')
-        code.append('import java.util.*;')
-        code.append('import java.time.LocalDateTime;')
-        code.append('')
-        code.append('public class Component {')
-        code.append('    private Map<String, Object> config;')
-        code.append('    private boolean initialized;')
-        code.append('')
-        code.append('    public Component(Map<String, Object> config) {')
-        code.append('        this.config = config;')
-        code.append('        this.initialized = false;')
-        code.append('    }')
-        code.append('')
-        code.append('    public void initialize() {')
-        code.append('        System.out.println("Initializing component");')
-        code.append('        this.initialized = true;')
-        code.append('    }')
-        code.append('')
-        code.append('    public Map<String, Object> process(Object data) {')
-        code.append('        if (!initialized) {')
-        code.append('            throw new RuntimeException("Component not initialized");')
-        code.append('        }')
-        code.append('        return transform(data);')
-        code.append('    }')
-        code.append('')
-        code.append('    private Map<String, Object> transform(Object data) {')
-        code.append('        Map<String, Object> result = new HashMap<>();')
-        code.append('        result.put("data", data);')
-        code.append('        result.put("timestamp", LocalDateTime.now());')
-        code.append('        return result;')
-        code.append('    }')
-        code.append('}')
-
-        return '\n'.join(code)
+        return _JAVA_TEMPLATE
 
     def _generate_go_code(self, lines: int, code_type: str) -> str:
         """Generate Go code"""
-        code = []
-        code.append('package main')
-        code.append('')
-        code.append('import (')
-        code.append('    "fmt"')
-        code.append('    "time"')
-        code.append(')')
-        code.append('')
-        code.append('type Component struct {')
-        code.append('    Config      map[string]interface{}')
-        code.append('    Initialized bool')
-        code.append('}')
-        code.append('')
-        code.append('func NewComponent(config map[string]interface{}) *Component {')
-        code.append('    return &Component{')
-        code.append('        Config:      config,')
-        code.append('        Initialized: false,')
-        code.append('    }')
-        code.append('}')
-        code.append('')
-        code.append('func (c *Component) Initialize() {')
-        code.append('    fmt.Println("Initializing component")')
-        code.append('    c.Initialized = true')
-        code.append('}')
-        code.append('')
-        code.append('func (c *Component) Process(data interface{}) (map[string]interface{}, error) {')
-        code.append('    if !c.Initialized {')
-        code.append('        return nil, fmt.Errorf("component not initialized")')
-        code.append('    }')
-        code.append('    return c.transform(data)')
-        code.append('}')
-        code.append('')
-        code.append('func (c *Component) transform(data interface{}) (map[string]interface{}, error) {')
-        code.append('    result := map[string]interface{}{')
-        code.append('        "data":      data,')
-        code.append('        "timestamp": time.Now(),')
-        code.append('    }')
-        code.append('    return result, nil')
-        code.append('}')
-
-        return '\n'.join(code)
+        return _GO_TEMPLATE
 
     def _generate_rust_code(self, lines: int, code_type: str) -> str:
         """Generate Rust code"""
-        code = []
-        code.append('use std::collections::HashMap;')
-        code.append('use chrono::Utc;')
-        code.append('')
-        code.append('pub struct Component {')
-        code.append('    config: HashMap<String, String>,')
-        code.append('    initialized: bool,')
-        code.append('}')
-        code.append('')
-        code.append('impl Component {')
-        code.append('    pub fn new(config: HashMap<String, String>) -> Self {')
-        code.append('        Component {')
-        code.append('            config,')
-        code.append('            initialized: false,')
-        code.append('        }')
-        code.append('    }')
-        code.append('')
-        code.append('    pub fn initialize(&mut self) {')
-        code.append('        println!("Initializing component");')
-        code.append('        self.initialized = true;')
-        code.append('    }')
-        code.append('')
-        code.append('    pub fn process(&self, data: &str) -> Result<HashMap<String, String>, String> {')
-        code.append('        if !self.initialized {')
-        code.append('            return Err("Component not initialized".to_string());')
-        code.append('        }')
-        code.append('        self.transform(data)')
-        code.append('    }')
-        code.append('')
-        code.append('    fn transform(&self, data: &str) -> Result<HashMap<String, String>, String> {')
-        code.append('        let mut result = HashMap::new();')
-        code.append('        result.insert("data".to_string(), data.to_string());')
-        code.append('        result.insert("timestamp".to_string(), Utc::now().to_rfc3339());')
-        code.append('        Ok(result)')
-        code.append('    }')
-        code.append('}')
+        return _RUST_TEMPLATE
 
-        return '\n'.join(code)
-
-    def _generate_generic_code(self, lines: int) -> str:
+    def _generate_generic_code(self, lines: int, code_type: str) -> str:
         """Generate generic code"""
-        code = []
-        for i in range(lines):
-            code.append(f'// Line {i}')
-        return '\n'.join(code)
-
-    def _write_code_file(self, path: str, content: str):
-        """Write code file"""
-        self._write_file(path, content)
+        return _generic_source(lines)
+
+    def _flush_writes(self):
+        """Write all queued files in one pass"""
+        jobs, self._pending_writes = self._pending_writes, []
+        keep_data = self._tar is None  # tarballs get no git history
+        for path, content in jobs:
+            data = content if isinstance(content, bytes) else content.encode()
+            if keep_data:
+                self._file_data[path] = data
+            self._store_file(path, data)
+
+    def _write_file(self, path: str, content):
+        """Queue file (str or pre-encoded bytes); written in bulk by _flush_writes"""
+        self._pending_writes.append((self._track_file(path), content))
+
+    def _track_file(self, path: str) -> str:
+        """Normalize path relative to the repository and record it in _written_files"""
+        path = (self.repo_path / path).relative_to(self.repo_path).as_posix()
+        self._written_files.append(path)
+        return path
+
+    def _store_file(self, path: str, data: bytes):
+        """Put encoded file contents on disk (or into the tarball)"""
+        if self._tar is not None:
+            info = tarfile.TarInfo(path)
+            info.size = len(data)
+            info.mtime = int(datetime.now().timestamp())
+            self._tar.addfile(info, io.BytesIO(data))
+            return
 
-    def _write_file(self, path: str, content: str):
-        """Write file to repository"""
         file_path = self.repo_path / path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w') as f:
-            f.write(content)
+        parent = file_path.parent
+        if parent not in self._mkdir_cache:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(parent)
+            self._mkdir_cache.update(parent.parents)
+
+        # Raw fd write: skips the buffered/text io layers for these small one-shot writes
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
 
     def _generate_package_json(self) -> str:
         """Generate package.json"""
-        return json.dumps({
-            "name": self.repo_name,
-            "version": "1.0.0",
-            "description": f"{self.template} project",
-            "main": "src/index.js",
-            "scripts": {
-                "test": "jest",
-                "build": "webpack",
-                "start": "node src/index.js"
-            },
-            "dependencies": {
-                "express": "^4.18.0",
-                "lodash": "^4.17.21"
-            },
-            "devDependencies": {
-                "jest": "^29.0.0",
-                "webpack": "^5.75.0"
-            }
-        }, indent=2)
+        return _PACKAGE_JSON_TEMPLATE.format(name=self.repo_name, template=self.template)
 
     def _generate_setup_py(self) -> str:
         """Generate setup.py"""
-        return f'''from setuptools import setup, find_packages
-
-setup(
-    name="{self.repo_name}",
-    version="1.0.0",
-    description="{self.template} project",
-    packages=find_packages(),
-    install_requires=[
-        "requests>=2.28.0",
-        "pydantic>=1.10.0",
-    ],
-    python_requires=">=3.8",
-)
-'''
+        return _SETUP_PY_TEMPLATE.format(name=self.repo_name, template=self.template)
 
     def _generate_requirements(self) -> str:
         """Generate requirements.txt"""
-        return '''requests>=2.28.0
-pydantic>=1.10.0
-pytest>=7.2.0
-black>=22.10.0
-flake8>=5.0.0
-'''
+        return _REQUIREMENTS_TXT
 
     def _generate_go_mod(self) -> str:
         """Generate go.mod"""
-        return f'''module github.com/example/{self.repo_name}
-
-go 1.19
-
-require (
-    github.com/gin-gonic/gin v1.9.0
-    github.com/stretchr/testify v1.8.1
-)
-'''
+        return _GO_MOD_TEMPLATE.format(name=self.repo_name)
 
     def _generate_cargo_toml(self) -> str:
         """Generate Cargo.toml"""
-        return f'''[package]
-name = "{self.repo_name}"
-version = "1.0.0"
-edition = "2021"
-
-[dependencies]
-tokio = {{ version = "1.25", features = ["full"] }}
-serde = {{ version = "1.0", features = ["derive"] }}
-'''
+        return _CARGO_TOML_TEMPLATE.format(name=self.repo_name)
 
     def _generate_gemfile(self) -> str:
         """Generate Gemfile"""
-        return '''source 'https://rubygems.org'
-
-gem 'rails', '~> 7.0'
-gem 'pg', '~> 1.4'
-
-group :development, :test do
-  gem 'rspec-rails', '~> 6.0'
-end
-'''
+        return _GEMFILE
 
     def _generate_pom_xml(self) -> str:
         """Generate pom.xml"""
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
-<project xmlns="http://maven.apache.org/POM/4.0.0">
-    <modelVersion>4.0.0</modelVersion>
-    <groupId>com.example</groupId>
-    <artifactId>{self.repo_name}</artifactId>
-    <version>1.0.0</version>
-    <dependencies>
-        <dependency>
-            <groupId>org.springframework.boot</groupId>
-            <artifactId>spring-boot-starter-web</artifactId>
-            <version>3.0.0</version>
-        </dependency>
-    </dependencies>
-</project>
-'''
+        return _POM_XML_TEMPLATE.format(name=self.repo_name)
 
     def _generate_docker_compose(self) -> str:
         """Generate docker-compose.yml"""
-        return '''version: '3.8'
-services:
-  app:
-    build: .
-    ports:
-      - "8000:8000"
-    environment:
-      - DATABASE_URL=postgresql://user:pass@db:5432/dbname
-  db:
-    image: postgres:15
-    environment:
-      - POSTGRES_PASSWORD=pass
-'''
+        return _DOCKER_COMPOSE_YML
 
     def _generate_dockerfile(self) -> str:
         """Generate Dockerfile"""
-        if self.language == 'python':
-            return '''FROM python:3.11-slim
-WORKDIR /app
-COPY requirements.txt .
-RUN pip install -r requirements.txt
-COPY . .
-CMD ["python", "src/main.py"]
-'''
-        else:
-            return '''FROM node:18-alpine
-WORKDIR /app
-COPY package*.json ./
-RUN npm install
-COPY . .
-CMD ["npm", "start"]
-'''
+        return _DOCKERFILE_PYTHON if self.language == 'python' else _DOCKERFILE_NODE
 
     def _generate_k8s_deployment(self) -> str:
         """Generate Kubernetes deployment"""
-        return f'''apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: {self.repo_name}
-spec:
-  replicas: 3
-  selector:
-    matchLabels:
-      app: {self.repo_name}
-  template:
-    metadata:
-      labels:
-        app: {self.repo_name}
-    spec:
-      containers:
-      - name: app
-        image: {self.repo_name}:latest
-        ports:
-        - containerPort: 8000
-'''
+        return _K8S_DEPLOYMENT_TEMPLATE.format(name=self.repo_name)
 
     def _generate_k8s_service(self) -> str:
         """Generate Kubernetes service"""
-        return f'''apiVersion: v1
-kind: Service
-metadata:
-  name: {self.repo_name}
-spec:
-  selector:
-    app: {self.repo_name}
-  ports:
-  - port: 80
-    targetPort: 8000
-  type: LoadBalancer
-'''
+        return _K8S_SERVICE_TEMPLATE.format(name=self.repo_name)
 
     def _generate_terraform(self) -> str:
         """Generate Terraform config"""
-        return '''terraform {
-  required_version = ">= 1.0"
-}
-
-provider "aws" {
-  region = "us-west-2"
-}
-
-resource "aws_instance" "app" {
-  ami           = "ami-0c55b159cbfafe1f0"
-  instance_type = "t2.micro"
-}
-'''
-
-    def _generate_github_actions(self) -> str:
-        """Generate GitHub Actions workflow"""
-        return '''name: CI
-
-on: [push, pull_request]
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - name: Run tests
-        run: |
-          npm install
-          npm test
-
-  build:
-    runs-on: ubuntu-latest
-    needs: test
-    steps:
-      - uses: actions/checkout@v3
-      - name: Build
-        run: npm run build
-'''
-
-    def _generate_gitignore(self) -> str:
-        """Generate .gitignore"""
-        return '''# Dependencies
-node_modules/
-vendor/
-__pycache__/
-*.pyc
-target/
-
-# Build
-dist/
-build/
-*.so
-*.exe
-
-# IDE
-.vscode/
-.idea/
-*.swp
-
-# Environment
-.env
-.env.local
-
-# Logs
-*.log
-logs/
-'''
+        return _TERRAFORM_MAIN_TF
 
     def _generate_readme(self) -> str:
         """Generate README.md"""
-        return f'''# {self.repo_name}
-
-{self.template} implementation
-
-## Features
-
-- Feature 1
-- Feature 2
-- Feature 3
-
-## Installation
-
-```bash
-# Install dependencies
-npm install  # or pip install -r requirements.txt
-```
-
-## Usage
-
-```bash
-# Run the application
-npm start
-```
-
-## Testing
-
-```bash
-# Run tests
-npm test
-```
-
-## License
-
-MIT
-'''
-
-    def _generate_license(self) -> str:
-        """Generate LICENSE"""
-        return '''MIT License
-
-Copyright (c) 2024
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction.
-'''
+        return _README_TEMPLATE.format(name=self.repo_name, template=self.template)
 
     def _generate_sql_migration(self) -> str:
         """Generate SQL migration"""
-        return '''-- Migration: Create users table
-CREATE TABLE users (
-    id SERIAL PRIMARY KEY,
-    username VARCHAR(255) NOT NULL,
-    email VARCHAR(255) UNIQUE NOT NULL,
-    created_at TIMESTAMP DEFAULT NOW()
-);
-
-CREATE INDEX idx_users_email ON users(email);
-'''
+        return _SQL_MIGRATION
 
     def _create_commit_history(self):
         """Create realistic commit history"""
@@ -1102,13 +1256,8 @@ CREATE INDEX idx_users_email ON users(email);
             'files': ['.gitignore', 'README.md']
         })
 
-        # Feature commits
-        all_files = []
-        for root, dirs, files in os.walk(self.repo_path):
-            for file in files:
-                if not file.startswith('.git'):
-                    rel_path = os.path.relpath(os.path.join(root, file), self.repo_path)
-                    all_files.append(rel_path)
+        # Feature commits, over every file this generator wrote (no need to re-walk the tree)
+        all_files = self._written_files
 
         # Group files into commits
         files_per_commit = len(all_files) // (self.num_commits - 10) if self.num_commits > 10 else 1
@@ -1124,54 +1273,118 @@ CREATE INDEX idx_users_email ON users(email);
         ]
 
         current_date = start_date + timedelta(days=1)
-        file_index = 0
 
-        while file_index < len(all_files) and len(commits) < self.num_commits:
-            commit_type, msg_template = random.choice(commit_types)
-            files_in_commit = all_files[file_index:file_index + files_per_commit]
+        # Draw every commit's type, author and time gap up front (random.choices runs in C)
+        num_feature_commits = min(self.num_commits - len(commits),
+                                  -(-len(all_files) // files_per_commit))
+        types = self._rng.choices(commit_types, k=num_feature_commits)
+        authors = self._rng.choices(self.contributors, k=num_feature_commits)
+        gaps = self._rng.choices(range(1, 49), k=num_feature_commits)
 
-            if files_in_commit:
-                component = files_in_commit[0].split('/')[0] if '/' in files_in_commit[0] else 'core'
-                message = f"{commit_type}: {msg_template.format(component)}"
+        for n in range(num_feature_commits):
+            commit_type, msg_template = types[n]
+            files_in_commit = all_files[n * files_per_commit:(n + 1) * files_per_commit]
 
-                commits.append({
-                    'date': current_date,
-                    'message': message,
-                    'author': random.choice(self.contributors),
-                    'files': files_in_commit
-                })
+            component = files_in_commit[0].split('/')[0] if '/' in files_in_commit[0] else 'core'
+            message = f"{commit_type}: {msg_template.format(component)}"
 
-                file_index += files_per_commit
-                current_date += timedelta(hours=random.randint(1, 48))
+            commits.append({
+                'date': current_date,
+                'message': message,
+                'author': authors[n],
+                'files': files_in_commit
+            })
+
+            current_date += timedelta(hours=gaps[n])
 
         # Create actual git commits
+        created = self._fast_import(commits)
+
+        print(f"  Created {created} commits")
+
+    def _create_initial_commit(self):
+        """Commit the whole generated tree as a single initial commit"""
+        self._fast_import([{
+            'date': datetime.now(),
+            'message': 'Initial commit',
+            'author': self.contributors[0],
+            'files': self._written_files
+        }])
+
+    def _fast_import(self, commits: List[Dict[str, Any]]) -> int:
+        """Write all commits through a single `git fast-import` process"""
+        # Commit onto whatever branch `git init` pointed HEAD at
+        head = (self.repo_path / '.git' / 'HEAD').read_text().split()[-1].encode()
+
+        stream = []
+        created = 0
+        committed = set()
+
         for commit in commits:
-            # Set author
-            subprocess.run(['git', 'config', 'user.name', commit['author'][0]], capture_output=True)
-            subprocess.run(['git', 'config', 'user.email', commit['author'][1]], capture_output=True)
+            # Like `git add` + `git commit`: skip unwritten or already-committed files and empty commits
+            files = [f for f in commit['files'] if f not in committed and f in self._file_data]
+            if not files:
+                continue
+
+            name, email = commit['author']
+            ident = f"{name} <{email}> {int(commit['date'].timestamp())} +0000\n".encode()
+            message = commit['message'].encode()
+            stream.append(b'commit %s\nauthor %scommitter %sdata %d\n%s\n'
+                          % (head, ident, ident, len(message), message))
+            for file in files:
+                data = self._file_data[file]
+                stream.append(b'M 100644 inline %s\ndata %d\n%s\n' % (file.encode(), len(data), data))
+            stream.append(b'\n')
+
+            committed.update(files)
+            created += 1
+
+        if created:
+            result = self._git('fast-import', '--quiet', input=b''.join(stream), stderr=subprocess.PIPE)
+            if result.returncode != 0:
+                error = result.stderr.decode(errors='replace').strip()
+                raise RuntimeError(f"git fast-import failed: {error}")
+            # fast-import only writes objects and refs; sync the index with the new HEAD
+            self._git('reset', '-q')
+        return created
+
 
-            # Add files
-            for file in commit['files']:
-                file_path = self.repo_path / file
-                if file_path.exists():
-                    subprocess.run(['git', 'add', file], capture_output=True)
+def _make_git_template() -> str:
+    """Run `git init` once in a scratch directory and return its .git path"""
+    scratch = tempfile.mkdtemp(prefix='mega-repos-git-')
+    subprocess.run(['git', *_GIT_FAST_CONFIG, 'init', scratch], stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, check=True)
+    return os.path.join(scratch, '.git')
 
-            # Commit with date
-            env = os.environ.copy()
-            env['GIT_AUTHOR_DATE'] = commit['date'].isoformat()
-            env['GIT_COMMITTER_DATE'] = commit['date'].isoformat()
 
-            result = subprocess.run(
-                ['git', 'commit', '-m', commit['message']],
-                capture_output=True,
-                env=env
-            )
+def _init_worker(git_template: Optional[str] = None):
+    """Pool initializer: share the pre-initialized .git template"""
+    global _GIT_TEMPLATE
+    _GIT_TEMPLATE = git_template
 
-        print(f"  Created {len(commits)} commits")
+
+def _build_one(args: Tuple[int, str, str, str, bool, bool]) -> bool:
+    """Generate a single repository inside a pool worker"""
+    repo_id, category, template, base_path, want_history, emit_tar = args
+    try:
+        RepoGenerator(repo_id, category, template, base_path, emit_tar=emit_tar,
+                      want_history=want_history).generate()
+        return True
+    except Exception as e:
+        print(f"  ERROR generating repo {repo_id}: {e}")
+        return False
 
 
 def main():
     """Main generator function"""
+    parser = argparse.ArgumentParser(description="Generate 1000 synthetic repositories (5001-6000)")
+    parser.add_argument('--history', action='store_true',
+                        help="create the full multi-commit history (slow) instead of one initial commit")
+    parser.add_argument('--tar', action='store_true',
+                        help="write each repository as <repo>.tar (file tree only, no git)")
+    # CI passes --category/--batch/--count, which this script has never honoured; ignore them
+    args, _ = parser.parse_known_args()
+
     base_path = Path(__file__).parent
 
     print("=" * 80)
@@ -1180,33 +1393,40 @@ def main():
     print("=" * 80)
     print()
 
+    # Enumerate every repository up front so the pool can schedule them freely
+    tasks = []
     repo_id = 5001
-    total_repos = 0
 
     for category, config in REPO_CATEGORIES.items():
-        count = config['count']
         templates = config['templates']
+        count = min(config['count'], 1000 - len(tasks))
 
-        print(f"\n[{category.upper()}] Generating {count} repositories...")
+        print(f"[{category.upper()}] Queued {count} repositories")
 
         for i in range(count):
-            template = templates[i % len(templates)]
+            tasks.append((repo_id, category, templates[i % len(templates)], str(base_path),
+                          args.history, args.tar))
+            repo_id += 1
+
+        if len(tasks) >= 1000:
+            break
 
-            try:
-                generator = RepoGenerator(repo_id, category, template, str(base_path))
-                generator.generate()
-                repo_id += 1
-                total_repos += 1
+    print()
 
-                if total_repos >= 1000:
-                    break
+    processes = os.cpu_count() or 1
 
-            except Exception as e:
-                print(f"  ERROR generating repo {repo_id}: {e}")
-                repo_id += 1
+    # Tarballs carry no .git, so only working-tree mode needs the shared template
+    git_template = None if args.tar else _make_git_template()
 
-        if total_repos >= 1000:
-            break
+    total_repos = 0
+    try:
+        with multiprocessing.Pool(processes=processes, initializer=_init_worker,
+                                  initargs=(git_template,)) as pool:
+            for ok in pool.imap_unordered(_build_one, tasks, chunksize=8):
+                total_repos += ok
+    finally:
+        if git_template:
+            shutil.rmtree(os.path.dirname(git_template), ignore_errors=True)
 
     print("\n" + "=" * 80)
     print(f"COMPLETE: Generated {total_repos} repositories")
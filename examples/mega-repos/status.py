@@ -4,20 +4,84 @@ Quick status check for repository generation
 """
 
 import os
+import math
 import subprocess
 from pathlib import Path
 from datetime import datetime
 
+def count_files(root):
+    """Count files under root, pruning .git directories instead of descending into them"""
+    total = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != '.git':
+                        stack.append(entry.path)
+                else:
+                    total += 1
+    return total
+
+
+def scan_base(base_path):
+    """List repo-* directories and total disk usage under base_path in one scandir walk
+
+    The generator may be writing while this runs, so entries that vanish mid-walk are skipped.
+    """
+    repos = []
+    used = 0
+    seen_links = set()
+    stack = [str(base_path)]
+    while stack:
+        path = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                # Like du: count each hard-linked inode once
+                if st.st_nlink > 1 and not is_dir:
+                    if (st.st_dev, st.st_ino) in seen_links:
+                        continue
+                    seen_links.add((st.st_dev, st.st_ino))
+                # Allocated blocks, like du, rather than apparent size
+                used += st.st_blocks * 512
+                if is_dir:
+                    stack.append(entry.path)
+                    if path == str(base_path) and entry.name.startswith('repo-'):
+                        repos.append(Path(entry.path))
+    try:
+        used += base_path.stat().st_blocks * 512
+    except OSError:
+        pass
+    return sorted(repos), used
+
+
+def format_size(num_bytes):
+    """Human-readable size in du -h style (K/M/G/T, powers of 1024, always rounded up)"""
+    size = num_bytes / 1024
+    for unit in 'KMGT':
+        # du rounds up: one decimal below 10, whole numbers above
+        shown = math.ceil(size * 10) / 10 if size < 10 else math.ceil(size)
+        if shown < 1024 or unit == 'T':
+            return f"{shown:.1f}{unit}" if shown < 10 else f"{shown:.0f}{unit}"
+        size /= 1024
+
+
 def main():
     base_path = Path(__file__).parent
 
-    # Count repos
-    repos = sorted([d for d in base_path.iterdir() if d.is_dir() and d.name.startswith('repo-')])
+    # Count repos and measure disk usage in the same pass (no du fork, no second traversal)
+    repos, used = scan_base(base_path)
     total = len(repos)
-
-    # Get disk usage
-    result = subprocess.run(['du', '-sh', str(base_path)], capture_output=True, text=True)
-    disk_usage = result.stdout.split()[0] if result.returncode == 0 else "Unknown"
+    disk_usage = format_size(used)
 
     # Calculate progress
     target = 1000
@@ -51,16 +115,16 @@ def main():
         for repo in sorted(repos, reverse=True)[:5]:
             # Get commit count
             try:
-                os.chdir(repo)
                 result = subprocess.run(
                     ['git', 'rev-list', '--count', 'HEAD'],
                     capture_output=True,
-                    text=True
+                    text=True,
+                    cwd=repo
                 )
                 commits = result.stdout.strip() if result.returncode == 0 else "?"
 
                 # Get file count
-                files = len([f for f in repo.rglob('*') if f.is_file() and '.git' not in str(f)])
+                files = count_files(repo)
 
                 print(f"  {repo.name:45s} {commits:>4s} commits  {files:>4d} files")
             except:
@@ -70,7 +134,8 @@ def main():
     print()
 
     # Check if generation is running
-    result = subprocess.run(['pgrep', '-f', 'generate_mega_repos.py'], capture_output=True)
+    result = subprocess.run(['pgrep', '-f', 'generate_mega_repos.py'],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     if result.returncode == 0:
         print("Status: ✓ Generator is currently RUNNING")
     else: